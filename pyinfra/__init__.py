@@ -13,8 +13,15 @@ logger = logging.getLogger("pyinfra")
 # Trigger context module creation
 from .context import config, host, init_base_classes, inventory, state  # noqa
 
-# Setup package level version
-from .version import __version__  # noqa
+
+def __getattr__(name):
+    # Package level version, resolved lazily by pyinfra.version
+    if name == "__version__":
+        from . import version
+
+        return version.__version__
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # Initialise base classes - this sets the context modules to point at the underlying
 # class objects (Host, etc), which makes ipython/etc work as expected.
@@ -2,15 +2,18 @@ try:
     import importlib_metadata
 except ImportError:
     import importlib.metadata as importlib_metadata  # type: ignore[no-redef]
-from os import path
-from typing import Iterable, Optional, Set
+
+from functools import lru_cache
+from os import path, stat
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
 from packaging.markers import Marker
 from packaging.requirements import Requirement
 from packaging.specifiers import SpecifierSet
+from packaging.utils import canonicalize_name
 from packaging.version import Version
 
-from pyinfra import __version__, state
+from pyinfra import state, version as pyinfra_version
 
 from .exceptions import PyinfraError
 
@@ -54,20 +57,67 @@ class ConfigDefaults:
 
 
 config_defaults = {key: value for key, value in ConfigDefaults.__dict__.items() if key.isupper()}
+_CONFIG_KEYS = tuple(config_defaults)
+
+
+@lru_cache(maxsize=None)
+def _parse_version(version: str) -> Version:
+    return Version(version)
+
+
+@lru_cache(maxsize=None)
+def _parse_specifier_set(specifiers: str) -> SpecifierSet:
+    return SpecifierSet(specifiers)
 
 
 def check_pyinfra_version(version: str):
     if not version:
         return
-    running_version = Version(__version__)
-    required_versions = SpecifierSet(version)
+    running_version = pyinfra_version.__version__
+    required_versions = _parse_specifier_set(version)
 
-    if running_version not in required_versions:
+    if _parse_version(running_version) not in required_versions:
         raise PyinfraError(
-            f"pyinfra version requirement not met (requires {version}, running {__version__})"
+            f"pyinfra version requirement not met (requires {version}, running {running_version})"
         )
 
 
+# Requirement strings are highly repetitive across packages' dependencies
+@lru_cache(maxsize=None)
+def _parse_requirement(requirement: str) -> Requirement:
+    return Requirement(requirement)
+
+
+@lru_cache(maxsize=None)
+def _get_dist(name: str) -> Optional[Tuple[str, List[str]]]:
+    """
+    Get the version and dependencies of an installed distribution package, or
+    ``None`` if it's not installed. ``importlib.metadata`` does no caching and
+    reads the METADATA file on every attribute access, so read both eagerly. Results
+    are cached for the lifetime of the process.
+    """
+
+    try:
+        dist = importlib_metadata.distribution(name)
+    except importlib_metadata.PackageNotFoundError:
+        return None
+    return dist.version, list(dist.requires or [])
+
+
+def _evaluate_marker(marker: Marker, extras_envs: Tuple[Dict[str, str], ...]) -> bool:
+    if not extras_envs:
+        return marker.evaluate()
+
+    for env in extras_envs:
+        if marker.evaluate(env):
+            return True
+    return False
+
+
+def _get_requirement_key(req: Requirement) -> Tuple[str, str, frozenset]:
+    return canonicalize_name(req.name), str(req.specifier), frozenset(req.extras)
+
+
 def _check_requirements(requirements: Iterable[str]) -> Set[Requirement]:
     """
     Check whether each of the given requirements and all their dependencies are
@@ -110,33 +160,43 @@ def _check_requirements(requirements: Iterable[str]) -> Set[Requirement]:
     # hbutils.system.check_reqs() from the hbutils package was also helpful in
     # clarifying what this is supposed to do.
 
-    reqs_to_check: Set[Requirement] = set(Requirement(r) for r in requirements)
-    reqs_satisfied: Set[Requirement] = set()
+    # Requirements are de-duplicated by canonical name, specifier & extras rather than
+    # relying on Requirement equality, which is identity based in older packaging.
+    reqs_to_check: List[Requirement] = []
+    reqs_seen: Set[Tuple[str, str, frozenset]] = set()
     reqs_not_satisfied: Set[Requirement] = set()
 
+    for requirement in requirements:
+        req = _parse_requirement(requirement)
+        req_key = _get_requirement_key(req)
+        if req_key not in reqs_seen:
+            reqs_seen.add(req_key)
+            reqs_to_check.append(req)
+
     while reqs_to_check:
         req = reqs_to_check.pop()
-        assert req not in reqs_satisfied and req not in reqs_not_satisfied
+        name = canonicalize_name(req.name)
 
-        # Check for an installed distribution package with the right name and version
-        try:
-            dist = importlib_metadata.distribution(req.name)
-        except importlib_metadata.PackageNotFoundError:
+        # Check for an installed distribution package with the right name
+        dist = _get_dist(name)
+        if dist is None:
             # No installed package with the right name
             # This would raise a DistributionNotFound error from pkg_resources.require()
             reqs_not_satisfied.add(req)
             continue
 
-        if dist.version not in req.specifier:
+        dist_version, dist_requires = dist
+        if dist_version not in req.specifier:
             # There is a distribution with the right name but wrong version
             # This would raise a VersionConflict error from pkg_resources.require()
             reqs_not_satisfied.add(req)
             continue
 
-        reqs_satisfied.add(req)
+        if not dist_requires:
+            continue
 
-        # If the distribution package has dependencies of its own, go through
-        # those dependencies and for each one add it to the set to be checked if
+        # The distribution package has dependencies of its own, go through
+        # those dependencies and for each one add it to the list to be checked if
         # - it's unconditional (no marker)
         # - or it's conditional and the condition is satisfied (the marker
         #   evaluates to true) in the current environment
@@ -144,26 +204,36 @@ def _check_requirements(requirements: Iterable[str]) -> Set[Requirement]:
         # etc., and/or they can check which extras of the distribution package
         # were required. To facilitate checking extras we have to pass the extra
         # in the environment when calling Marker.evaluate().
-        if dist.requires:
-            if req.extras:
-                extras_envs = [{"extra": extra} for extra in req.extras]
+        extras_envs = tuple({"extra": extra} for extra in req.extras)
 
-                def evaluate_marker(marker: Marker) -> bool:
-                    return any(map(marker.evaluate, extras_envs))
+        for dist_req_str in dist_requires:
+            dist_req = _parse_requirement(dist_req_str)
+            dist_req_key = _get_requirement_key(dist_req)
+            if dist_req_key in reqs_seen:
+                continue
+            if (not dist_req.marker) or _evaluate_marker(dist_req.marker, extras_envs):
+                reqs_seen.add(dist_req_key)
+                reqs_to_check.append(dist_req)
 
-            else:
+    return reqs_not_satisfied
 
-                def evaluate_marker(marker: Marker) -> bool:
-                    return marker.evaluate()
 
-            for dist_req_str in dist.requires:
-                dist_req = Requirement(dist_req_str)
-                if dist_req in reqs_satisfied or dist_req in reqs_not_satisfied:
-                    continue
-                if (not dist_req.marker) or evaluate_marker(dist_req.marker):
-                    reqs_to_check.add(dist_req)
+# Config checkers run every time the config is set/copied/restored, so cache both the
+# contents of requirements files (by path & mtime) and the results of checking them.
+_REQUIREMENTS_FILES: Dict[Tuple[str, float], List[str]] = {}
+_REQUIREMENTS_NOT_MET: Dict[FrozenSet[str], Set[Requirement]] = {}
 
-    return reqs_not_satisfied
+
+def _read_requirements_file(filename: str) -> List[str]:
+    cache_key = (filename, stat(filename).st_mtime)
+    requirements = _REQUIREMENTS_FILES.get(cache_key)
+
+    if requirements is None:
+        with open(filename, encoding="utf-8") as f:
+            requirements = [line.split("#egg=")[-1] for line in f.read().splitlines()]
+        _REQUIREMENTS_FILES[cache_key] = requirements
+
+    return requirements
 
 
 def check_require_packages(requirements_config):
@@ -173,10 +243,15 @@ def check_require_packages(requirements_config):
     if isinstance(requirements_config, (list, tuple)):
         requirements = requirements_config
     else:
-        with open(path.join(state.cwd or "", requirements_config), encoding="utf-8") as f:
-            requirements = [line.split("#egg=")[-1] for line in f.read().splitlines()]
+        requirements = _read_requirements_file(path.join(state.cwd or "", requirements_config))
+
+    cache_key = frozenset(requirements)
+    requirements_not_met = _REQUIREMENTS_NOT_MET.get(cache_key)
+    if requirements_not_met is None:
+        requirements_not_met = _REQUIREMENTS_NOT_MET[cache_key] = _check_requirements(
+            requirements,
+        )
 
-    requirements_not_met = _check_requirements(requirements)
     if requirements_not_met:
         raise PyinfraError(
             "Deploy requirements ({0}) not met: missing {1}".format(
@@ -189,6 +264,7 @@ config_checkers = {
     "REQUIRE_PYINFRA_VERSION": check_pyinfra_version,
     "REQUIRE_PACKAGES": check_require_packages,
 }
+_CHECKED_KEYS = frozenset(config_checkers)
 
 
 class Config(ConfigDefaults):
@@ -201,21 +277,20 @@ class Config(ConfigDefaults):
         env = kwargs.pop("ENV", {})
         self.ENV = env
 
-        config = config_defaults.copy()
-        config.update(kwargs)
+        # Defaults never need checking, so set them in one go bypassing our __setattr__
+        self.__dict__.update(config_defaults)
 
-        for key, value in config.items():
+        for key, value in kwargs.items():
             setattr(self, key, value)
 
     def __setattr__(self, key, value):
         super().__setattr__(key, value)
 
-        checker = config_checkers.get(key)
-        if checker:
-            checker(value)
+        if key in _CHECKED_KEYS:
+            config_checkers[key](value)
 
     def get_current_state(self):
-        return [(key, getattr(self, key)) for key in config_defaults.keys()]
+        return [(key, getattr(self, key)) for key in _CONFIG_KEYS]
 
     def set_current_state(self, config_state):
         for key, value in config_state:
@@ -228,4 +303,4 @@ class Config(ConfigDefaults):
         self.set_current_state(self._locked_config)
 
     def copy(self) -> "Config":
-        return Config(**dict(self.get_current_state()))
+        return Config(**{key: getattr(self, key) for key in _CONFIG_KEYS}, ENV=self.ENV.copy())
@@ -1,13 +1,18 @@
+from functools import lru_cache
+
 try:
     from importlib_metadata import entry_points
 except ImportError:
     from importlib.metadata import entry_points  # type: ignore[assignment]
 
 
+@lru_cache(maxsize=None)
 def _load_connector(entrypoint):
     return entrypoint.load()
 
 
+# Entry point discovery reads distribution metadata from disk, so only do it once
+@lru_cache(maxsize=None)
 def get_all_connectors():
     return {
         entrypoint.name: _load_connector(entrypoint)
@@ -15,6 +20,7 @@ def get_all_connectors():
     }
 
 
+@lru_cache(maxsize=None)
 def get_execution_connectors():
     return {
         connector: connector_mod
@@ -25,3 +31,9 @@ def get_execution_connectors():
 
 def get_execution_connector(name):
     return get_execution_connectors()[name]
+
+
+def _clear_connector_cache():
+    _load_connector.cache_clear()
+    get_all_connectors.cache_clear()
+    get_execution_connectors.cache_clear()
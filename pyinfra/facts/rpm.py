@@ -5,10 +5,12 @@ import shlex
 
 from pyinfra.api import FactBase
 
-from .util.packaging import parse_packages
+from .util.packaging import parse_packages_iter
 
 rpm_regex = r"^(\S+)\ (\S+)$"
+_RPM_RE = re.compile(rpm_regex, re.MULTILINE)
 rpm_query_format = "%{NAME} %{VERSION}-%{RELEASE}\\n"
+_QUOTED_QUERY_FORMAT = shlex.quote(rpm_query_format)
 
 
 class RpmPackages(FactBase):
@@ -23,7 +25,7 @@ class RpmPackages(FactBase):
     """
 
     def command(self) -> str:
-        return "rpm --queryformat {0} -qa".format(shlex.quote(rpm_query_format))
+        return "rpm --queryformat {0} -qa".format(_QUOTED_QUERY_FORMAT)
 
     def requires_command(self) -> str:
         return "rpm"
@@ -31,7 +33,10 @@ class RpmPackages(FactBase):
     default = dict
 
     def process(self, output):
-        return parse_packages(rpm_regex, output)
+        packages: dict[str, set[str]] = {}
+        for name, version in parse_packages_iter(_RPM_RE, output):
+            packages.setdefault(name, set()).add(version)
+        return packages
 
 
 class RpmPackage(FactBase):
@@ -54,11 +59,11 @@ class RpmPackage(FactBase):
             "rpm --queryformat {0} -q {1} || "
             "! test -e {1} || "
             "rpm --queryformat {0} -qp {1} 2> /dev/null"
-        ).format(shlex.quote(rpm_query_format), shlex.quote(package))
+        ).format(_QUOTED_QUERY_FORMAT, shlex.quote(package))
 
     def process(self, output):
         for line in output:
-            matches = re.match(rpm_regex, line)
+            matches = _RPM_RE.match(line)
             if matches:
                 return {
                     "name": matches.group(1),
@@ -79,7 +84,7 @@ class RpmPackageProvides(FactBase):
     def command(self, package):
         # Accept failure here (|| true) for invalid/unknown packages
         return "repoquery --queryformat {0} --whatprovides {1} || true".format(
-            shlex.quote(rpm_query_format),
+            _QUOTED_QUERY_FORMAT,
             shlex.quote(package),
         )
 
@@ -87,7 +92,7 @@ class RpmPackageProvides(FactBase):
         packages = []
 
         for line in output:
-            matches = re.match(rpm_regex, line)
+            matches = _RPM_RE.match(line)
             if matches:
                 packages.append(list(matches.groups()))
 
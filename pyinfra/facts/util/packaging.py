@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable
+from typing import Iterable, Iterator
 
 
-def parse_packages(regex: str, output: Iterable[str]) -> dict[str, set[str]]:
+def parse_packages(regex: str | re.Pattern, output: Iterable[str]) -> dict[str, set[str]]:
+    if isinstance(regex, str):
+        regex = re.compile(regex)
+
     packages: dict[str, set[str]] = {}
 
     for line in output:
-        matches = re.match(regex, line)
+        matches = regex.match(line)
 
         if matches:
             name = matches.group(1)
@@ -18,6 +21,17 @@ def parse_packages(regex: str, output: Iterable[str]) -> dict[str, set[str]]:
     return packages
 
 
+def parse_packages_iter(regex: re.Pattern, output: Iterable[str]) -> Iterator[tuple[str, str]]:
+    """
+    Yield ``(name, version)`` for every line of output matching the regex, which should
+    be compiled with ``re.MULTILINE``. Matching the joined output in one go is faster
+    than matching each line for large package lists.
+    """
+
+    for matches in regex.finditer("\n".join(output)):
+        yield matches.group(1), matches.group(2)
+
+
 def _parse_yum_or_zypper_repositories(output):
     repos = []
 
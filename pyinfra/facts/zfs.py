@@ -2,17 +2,17 @@
 Manage ZFS filesystems.
 """
 
+from collections import defaultdict
+
 from pyinfra.api import FactBase, ShortFactBase
 
 
 def _process_zfs_props_table(output):
-    datasets: dict = {}
-    for line in output:
-        dataset, property, value, source = tuple(line.split("\t"))
-        if dataset not in datasets:
-            datasets[dataset] = {}
+    datasets: dict = defaultdict(dict)
+    rows = [line.split("\t", 3) for line in output if line]
+    for dataset, property, value, _source in rows:
         datasets[dataset][property] = value
-    return datasets
+    return dict(datasets)
 
 
 class Pools(FactBase):
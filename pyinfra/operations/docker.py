@@ -68,7 +68,8 @@ def container(
         )
     """
 
-    existent_container = host.get_fact(DockerContainer, object_id=container)
+    containers = host.get_fact(DockerContainer, object_id=container)
+    existent_container = containers[0] if containers else None
 
     if force:
         if existent_container:
@@ -96,7 +97,7 @@ def container(
             )
 
     if existent_container and start:
-        if existent_container[0]["State"]["Status"] != "running":
+        if existent_container["State"]["Status"] != "running":
             yield handle_docker(
                 resource="container",
                 command="start",
@@ -104,7 +105,7 @@ def container(
             )
 
     if existent_container and not start:
-        if existent_container[0]["State"]["Status"] == "running":
+        if existent_container["State"]["Status"] == "running":
             yield handle_docker(
                 resource="container",
                 command="stop",
@@ -201,7 +202,7 @@ def volume(volume, driver="", labels=None, present=True):
         )
 
     else:
-        if existent_volume is None:
+        if not existent_volume:
             host.noop("There is no {0} volume!".format(volume))
             return
 
@@ -283,13 +284,13 @@ def network(
         )
 
     else:
-        if existent_network is None:
+        if not existent_network:
             host.noop("Ther is not network with {0} name!".format(network))
             return
 
         yield handle_docker(
             resource="network",
-            command="create",
+            command="remove",
             network=network,
         )
 
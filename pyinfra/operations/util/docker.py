@@ -90,7 +90,7 @@ def _create_volume(**kwargs):
 
 
 def _remove_volume(**kwargs):
-    return "docker image rm {0}".format(kwargs["volume"])
+    return "docker volume rm {0}".format(kwargs["volume"])
 
 
 def _create_network(**kwargs):
@@ -1,9 +1,21 @@
-try:
-    try:
-        from importlib_metadata import version
-    except ImportError:
-        from importlib.metadata import version
-
-    __version__ = version("pyinfra")
-except Exception:
-    __version__ = "unknown"
+from typing import Optional
+
+_version: Optional[str] = None
+
+
+def __getattr__(name):
+    # Resolve the version lazily as reading the package metadata is slow and
+    # most runs never need it.
+    global _version
+
+    if name != "__version__":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    if _version is None:
+        try:
+            from importlib.metadata import version
+
+            _version = version("pyinfra")
+        except Exception:
+            _version = "unknown"
+    return _version
@@ -7,7 +7,7 @@ from typing import Iterable, List, Tuple, Union
 
 import click
 
-from pyinfra import __version__, logger, state
+from pyinfra import logger, state
 from pyinfra.api import Config, State
 from pyinfra.api.connect import connect_all, disconnect_all
 from pyinfra.api.exceptions import NoGroupError, PyinfraError
@@ -40,6 +40,16 @@ def _exit():
     sys.exit(0)
 
 
+def _print_version(ctx, param, value):
+    if not value:
+        return
+
+    from pyinfra import __version__
+
+    click.echo(f"pyinfra: v{__version__}")
+    ctx.exit()
+
+
 def _print_support(ctx, param, value):
     if not value:
         return
@@ -174,10 +184,14 @@ def _print_support(ctx, param, value):
     default=False,
     help="Print operations after generating and exit.",
 )
-@click.version_option(
-    version=__version__,
-    prog_name="pyinfra",
-    message="%(prog)s: v%(version)s",
+# Resolve the version only when requested, rather than using click.version_option
+@click.option(
+    "--version",
+    is_flag=True,
+    is_eager=True,
+    expose_value=False,
+    callback=_print_version,
+    help="Show the version and exit.",
 )
 def cli(*args, **kwargs):
     """
@@ -1,54 +1,105 @@
 from __future__ import annotations
 
 import json
-import platform
 import re
-import sys
-from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Tuple, Union
+from collections import Counter, defaultdict
+from heapq import heapify, heappop
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import click
 
-from pyinfra import __version__, logger
+from pyinfra import logger
 from pyinfra.api.host import Host
 
 from .util import json_encode
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from pyinfra.api.state import State
 
 
 ANSI_RE = re.compile(r"\033\[((?:\d|;)*)([a-zA-Z])")
-
-
-def _strip_ansi(value):
-    return ANSI_RE.sub("", value)
+_ansi_sub = ANSI_RE.sub
 
 
 def _get_group_combinations(inventory: Iterator[Host]):
-    group_combinations: Dict[Tuple, List[Host]] = {}
+    group_combinations: Dict[FrozenSet[str], List[Host]] = {}
 
     for host in inventory:
-        # Tuple for hashability, set to normalise order
-        host_groups = tuple(set(host.groups))
-
-        group_combinations.setdefault(host_groups, [])
-        group_combinations[host_groups].append(host)
+        # Frozenset for hashability & to normalise order
+        host_groups = frozenset(host.groups)
+        group_combinations.setdefault(host_groups, []).append(host)
 
     return group_combinations
 
 
-def _stringify_host_keys(data):
-    if isinstance(data, dict):
-        return {
-            key.name if isinstance(key, Host) else key: _stringify_host_keys(value)
-            for key, value in data.items()
-        }
+def _stringify_host_keys(data, _memo: Optional[Dict[int, Any]] = None):
+    """
+    Replace any ``Host`` dict keys with the host name, recursively. Dicts that contain
+    no ``Host`` keys (at any depth) are returned as-is rather than copied.
+    """
+
+    if not isinstance(data, dict):
+        return data
 
-    return data
+    if _memo is None:
+        _memo = {}
+    elif id(data) in _memo:
+        return _memo[id(data)]
+
+    stringified = None
+    for i, (key, value) in enumerate(data.items()):
+        new_key = key.name if isinstance(key, Host) else key
+        new_value = _stringify_host_keys(value, _memo)
+
+        if stringified is None:
+            if new_key is key and new_value is value:
+                continue
+            # First change, copy over the unchanged items so far
+            stringified = dict(islice(data.items(), i))
+
+        stringified[new_key] = new_value
+
+    result = data if stringified is None else stringified
+    _memo[id(data)] = result
+    return result
 
 
 def jsonify(data, *args, **kwargs):
     data = _stringify_host_keys(data)
+
+    # Use orjson where available & possible, it only supports 2 space indentation
+    if orjson is not None and not args and set(kwargs) <= {"indent", "default"}:
+        # Leave dataclasses & datetimes to the default encoder, like the stdlib does
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATACLASS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+        )
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(data, default=kwargs.get("default"), option=option).decode()
+        except TypeError:
+            pass  # fallback to the stdlib for anything orjson can't handle
+
     return json.dumps(data, *args, **kwargs)
 
 
@@ -65,9 +116,16 @@ def print_state_operations(state: "State"):
     click.echo(err=True)
     click.echo("--> Operation order:", err=True)
     click.echo(err=True)
+    op_to_hosts: Dict[str, set] = {}
+    for host, operations in state.ops.items():
+        for op_hash in operations:
+            op_to_hosts.setdefault(op_hash, set()).add(host)
+
+    op_meta_map = state.op_meta
+
     for op_hash in state.get_op_order():
-        meta = state.op_meta[op_hash]
-        hosts = set(host for host, operations in state.ops.items() if op_hash in operations)
+        meta = op_meta_map[op_hash]
+        hosts = op_to_hosts.get(op_hash, set())
 
         click.echo(
             "    {0} (names={1}, hosts={2})".format(
@@ -113,7 +171,7 @@ def print_inventory(state: "State"):
     for host in state.inventory:
         click.echo(err=True)
         click.echo(host.print_prefix, err=True)
-        click.echo("--> Groups: {0}".format(", ".join(host.groups)), err=True)
+        click.echo(f"--> Groups: {', '.join(host.groups)}", err=True)
         click.echo("--> Data:", err=True)
         click.echo(jsonify(host.data, indent=4, default=json_encode), err=True)
 
@@ -131,10 +189,14 @@ def print_facts(facts):
 
 
 def print_support_info():
+    import platform
+    import sys
     from importlib.metadata import PackageNotFoundError, requires, version
 
     from packaging.requirements import Requirement
 
+    from pyinfra import __version__
+
     click.echo(
         """
     If you are having issues with pyinfra or wish to make feature requests, please
@@ -172,42 +234,48 @@ def print_support_info():
 
 
 def print_rows(rows):
-    # Go through the rows and work out all the widths in each column
-    row_column_widths: list[list[int]] = []
+    # Strip any ansi codes from each column once, skipping the regex for uncoloured text
+    # (no tty, CI, etc), which is most text.
+    sub = _ansi_sub
+    stripped_rows: list[list[str] | None] = [
+        (
+            None
+            if isinstance(columns, str)
+            else [column if "\033" not in column else sub("", column) for column in columns]
+        )
+        for _, columns in rows
+    ]
+
+    # Go through the rows and work out the max width of each column
+    column_max_widths: list[int] = []
 
-    for _, columns in rows:
-        if isinstance(columns, str):
+    for stripped_columns in stripped_rows:
+        if stripped_columns is None:
             continue
 
-        for i, column in enumerate(columns):
-            if i >= len(row_column_widths):
-                row_column_widths.append([])
+        for i, stripped in enumerate(stripped_columns):
+            if i >= len(column_max_widths):
+                column_max_widths.append(0)
 
             # Length of the column (with ansi codes removed)
-            width = len(_strip_ansi(column.strip()))
-            row_column_widths[i].append(width)
+            width = len(stripped.strip())
+            if width > column_max_widths[i]:
+                column_max_widths[i] = width
 
-    # Get the max width of each column and add 4 padding spaces
-    column_widths = [max(widths) + 4 for widths in row_column_widths]
+    # Add 4 padding spaces to the max width of each column
+    column_widths = [width + 4 for width in column_max_widths]
 
     # Now print each column, keeping text justified to the widths above
-    for func, columns in rows:
+    for (func, columns), stripped_columns in zip(rows, stripped_rows):
         line = columns
 
-        if not isinstance(columns, str):
+        if stripped_columns is not None:
             justified = []
 
             for i, column in enumerate(columns):
-                stripped = _strip_ansi(column)
-                desired_width = column_widths[i]
-                padding = desired_width - len(stripped)
-
-                justified.append(
-                    "{0}{1}".format(
-                        column,
-                        " ".join("" for _ in range(padding)),
-                    ),
-                )
+                # Justify to the desired width plus any (invisible) ansi code characters
+                ansi_width = len(column) - len(stripped_columns[i])
+                justified.append(column.ljust(column_widths[i] + ansi_width))
 
             line = "".join(justified)
 
@@ -222,11 +290,32 @@ def truncate(text, max_length):
     return f"{text}..."
 
 
+def _truncated_join(names, max_length):
+    """
+    Equivalent to ``truncate(", ".join(sorted(names)), max_length)`` but only sorts as
+    many names as are needed to fill ``max_length``.
+    """
+
+    heap = list(names)
+    heapify(heap)
+
+    joined_names = []
+    length = -2  # no separator before the first name
+    while heap and length <= max_length:
+        name = heappop(heap)
+        joined_names.append(name)
+        length += len(name) + 2
+
+    return truncate(", ".join(joined_names), max_length)
+
+
+# Not cached: operation meta names & args change as more hosts add the same operation
 def pretty_op_name(op_meta):
-    name = list(op_meta.names)[0]
+    name = next(iter(op_meta.names))
 
     if op_meta.args:
-        name = "{0} ({1})".format(name, ", ".join(str(arg) for arg in op_meta.args))
+        args = ", ".join(str(arg) for arg in op_meta.args)
+        name = f"{name} ({args})"
 
     return name
 
@@ -236,38 +325,35 @@ def print_meta(state: "State"):
         (logger.info, ["Operation", "Change", "Conditional Change"]),
     ]
 
+    # Bucket host names by operation in one pass over each host's operations
+    hosts_in_op: DefaultDict[str, List[str]] = defaultdict(list)
+    hosts_maybe_in_op: DefaultDict[str, List[str]] = defaultdict(list)
+
+    for host in state.inventory.iter_activated_hosts():
+        host_name = host.name
+        for op_hash, op_data in state.ops[host].items():
+            if op_data.operation_meta._maybe_is_change:
+                if op_data.global_arguments["_if"]:
+                    hosts_maybe_in_op[op_hash].append(host_name)
+                else:
+                    hosts_in_op[op_hash].append(host_name)
+
+    op_meta_map = state.op_meta
+
     for op_hash in state.get_op_order():
-        hosts_in_op = []
-        hosts_maybe_in_op = []
-        for host in state.inventory.iter_activated_hosts():
-            if op_hash in state.ops[host]:
-                op_data = state.get_op_data_for_host(host, op_hash)
-                if op_data.operation_meta._maybe_is_change:
-                    if op_data.global_arguments["_if"]:
-                        hosts_maybe_in_op.append(host.name)
-                    else:
-                        hosts_in_op.append(host.name)
+        op_hosts = hosts_in_op.get(op_hash)
+        op_maybe_hosts = hosts_maybe_in_op.get(op_hash)
 
         rows.append(
             (
                 logger.info,
                 [
-                    pretty_op_name(state.op_meta[op_hash]),
-                    (
-                        "-"
-                        if len(hosts_in_op) == 0
-                        else "{0} ({1})".format(
-                            len(hosts_in_op),
-                            truncate(", ".join(sorted(hosts_in_op)), 48),
-                        )
-                    ),
+                    pretty_op_name(op_meta_map[op_hash]),
+                    ("-" if not op_hosts else f"{len(op_hosts)} ({_truncated_join(op_hosts, 48)})"),
                     (
                         "-"
-                        if len(hosts_maybe_in_op) == 0
-                        else "{0} ({1})".format(
-                            len(hosts_maybe_in_op),
-                            truncate(", ".join(sorted(hosts_maybe_in_op)), 48),
-                        )
+                        if not op_maybe_hosts
+                        else f"{len(op_maybe_hosts)} ({_truncated_join(op_maybe_hosts, 48)})"
                     ),
                 ],
             )
@@ -281,43 +367,44 @@ def print_results(state: "State"):
         (logger.info, ["Operation", "Hosts", "Success", "Error", "No Change"]),
     ]
 
-    for op_hash in state.get_op_order():
-        hosts_in_op = 0
-        hosts_in_op_success: list[str] = []
-        hosts_in_op_error: list[str] = []
-        hosts_in_op_no_change: list[str] = []
-        for host in state.inventory.iter_activated_hosts():
-            if op_hash not in state.ops[host]:
-                continue
-
-            hosts_in_op += 1
-
-            op_meta = state.ops[host][op_hash].operation_meta
-            if op_meta.did_succeed(_raise_if_not_complete=False):
-                if op_meta.did_change():
-                    hosts_in_op_success.append(host.name)
-                else:
-                    hosts_in_op_no_change.append(host.name)
+    # Bucket host names by operation in one pass over each host's operations
+    hosts_in_op_success: DefaultDict[str, List[str]] = defaultdict(list)
+    hosts_in_op_error: DefaultDict[str, List[str]] = defaultdict(list)
+    hosts_in_op_no_change: DefaultDict[str, List[str]] = defaultdict(list)
+    hosts_in_op: Counter[str] = Counter()
+
+    for host in state.inventory.iter_activated_hosts():
+        host_name = host.name
+        for op_hash, op_data in state.ops[host].items():
+            hosts_in_op[op_hash] += 1
+
+            op_meta = op_data.operation_meta
+            succeeded = op_meta.did_succeed(_raise_if_not_complete=False)
+            if not succeeded:
+                bucket = hosts_in_op_error
+            elif op_meta.did_change():
+                bucket = hosts_in_op_success
             else:
-                hosts_in_op_error.append(host.name)
+                bucket = hosts_in_op_no_change
+            bucket[op_hash].append(host_name)
+
+    op_meta_map = state.op_meta
 
+    for op_hash in state.get_op_order():
         row = [
-            pretty_op_name(state.op_meta[op_hash]),
-            str(hosts_in_op),
+            pretty_op_name(op_meta_map[op_hash]),
+            str(hosts_in_op[op_hash]),
         ]
 
-        if hosts_in_op_success:
-            row.append(f"{len(hosts_in_op_success)}")
-        else:
-            row.append("-")
-        if hosts_in_op_error:
-            row.append(f"{len(hosts_in_op_error)}")
-        else:
-            row.append("-")
-        if hosts_in_op_no_change:
-            row.append(f"{len(hosts_in_op_no_change)}")
-        else:
-            row.append("-")
+        for op_hosts in (
+            hosts_in_op_success.get(op_hash),
+            hosts_in_op_error.get(op_hash),
+            hosts_in_op_no_change.get(op_hash),
+        ):
+            if op_hosts:
+                row.append(f"{len(op_hosts)}")
+            else:
+                row.append("-")
 
         rows.append((logger.info, row))
 
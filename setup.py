@@ -43,6 +43,8 @@ TEST_REQUIRES = (
     "pytest==8.2.1",
     "coverage==7.5.1",
     "pytest-cov==5.0.0",
+    # Optional CLI dependencies
+    "orjson",
     # Formatting & linting
     "black==24.4.2",
     "isort==5.13.2",
@@ -87,8 +89,10 @@ def get_version_from_changelog():
     pattern = re.compile(r"^# v(?P<version>[0-9]+\.[0-9]+(\.[0-9]+)?(\.?[a-z0-9]+)?)$")
 
     with open("CHANGELOG.md", "r", encoding="utf-8") as fn:
-        for line in fn.readlines():
-            match = pattern.match(line.strip())
+        for line in fn:
+            if not line.startswith("# v"):
+                continue
+            match = pattern.match(line.rstrip())
             if match:
                 return "".join(match.group("version"))
     raise RuntimeError("No version found in CHANGELOG.md")
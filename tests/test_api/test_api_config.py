@@ -1,3 +1,5 @@
+from os import path
+from tempfile import TemporaryDirectory
 from unittest import TestCase
 from unittest.mock import patch
 
@@ -7,14 +9,53 @@ from pyinfra.api.exceptions import PyinfraError
 
 class TestStateApi(TestCase):
     def test_require_pyinfra_requirement_ok(self):
-        with patch("pyinfra.api.config.__version__", "100"):
+        with patch("pyinfra.version._version", "100"):
             Config(REQUIRE_PYINFRA_VERSION=">=100")
 
     def test_require_pyinfra_requirement_too_low(self):
         with self.assertRaises(PyinfraError) as context:
-            with patch("pyinfra.api.config.__version__", "99"):
+            with patch("pyinfra.version._version", "99"):
                 Config(REQUIRE_PYINFRA_VERSION=">=100")
 
         assert context.exception.args[0] == (
             "pyinfra version requirement not met (requires >=100, running 99)"
         )
+
+    def test_require_packages_ok(self):
+        Config(REQUIRE_PACKAGES=["click", "Jinja2>2"])
+
+    def test_require_packages_missing(self):
+        with self.assertRaises(PyinfraError) as context:
+            Config(REQUIRE_PACKAGES=["click", "not-a-real-package", "click<1"])
+
+        message = context.exception.args[0]
+        assert "missing" in message
+        assert "not-a-real-package" in message
+        assert "click<1" in message
+
+    def test_require_packages_file(self):
+        with TemporaryDirectory() as tempdir:
+            filename = path.join(tempdir, "requirements.txt")
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write("click\nnot-a-real-package\n")
+
+            for _ in range(2):
+                with self.assertRaises(PyinfraError) as context:
+                    Config(REQUIRE_PACKAGES=filename)
+
+                assert context.exception.args[0] == (
+                    f"Deploy requirements ({filename}) not met: missing not-a-real-package"
+                )
+
+    def test_copy(self):
+        config = Config(SUDO=True, ENV={"KEY": "value"})
+        config.CONNECT_TIMEOUT = 30
+
+        config_copy = config.copy()
+        assert config_copy.get_current_state() == config.get_current_state()
+        assert config_copy.ENV == {"KEY": "value"}
+        assert config_copy.ENV is not config.ENV
+
+    def test_class_defaults(self):
+        assert Config.SUDO is False
+        assert Config.SHELL == "sh"
@@ -0,0 +1,27 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from pyinfra.api import connectors
+from pyinfra.connectors.local import LocalConnector
+
+
+class TestConnectorsApi(TestCase):
+    def setUp(self):
+        connectors._clear_connector_cache()
+
+    def tearDown(self):
+        connectors._clear_connector_cache()
+
+    def test_get_execution_connector(self):
+        assert connectors.get_execution_connector("local") is LocalConnector
+
+    def test_entry_points_loaded_once(self):
+        with patch(
+            "pyinfra.api.connectors.entry_points",
+            wraps=connectors.entry_points,
+        ) as fake_entry_points:
+            connectors.get_execution_connector("local")
+            connectors.get_execution_connector("ssh")
+            connectors.get_all_connectors()
+
+        fake_entry_points.assert_called_once_with(group="pyinfra.connectors")
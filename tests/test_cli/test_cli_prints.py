@@ -0,0 +1,165 @@
+import json
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+import click
+
+from pyinfra.api import Config, Inventory, State
+from pyinfra.api.connect import connect_all
+from pyinfra.api.operation import add_op
+from pyinfra.api.operations import run_ops
+from pyinfra.api.state import StateOperationMeta
+from pyinfra.operations import server
+from pyinfra_cli.prints import (
+    _stringify_host_keys,
+    _truncated_join,
+    jsonify,
+    pretty_op_name,
+    print_meta,
+    print_results,
+    print_rows,
+    print_state_operations,
+)
+from pyinfra_cli.util import json_encode
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from ..paramiko_util import PatchSSHTestCase
+from ..util import make_inventory
+
+
+class TestCliPrints(TestCase):
+    def test_jsonify(self):
+        inventory = Inventory((["somehost"], {}))
+        host = inventory.get_host("somehost")
+
+        data = {host: {"items": {"b", "a"}, 1: None}}
+        output = jsonify(data, indent=4, default=json_encode)
+        assert json.loads(output) == {"somehost": {"items": ["a", "b"], "1": None}}
+
+    @skipUnless(orjson, "orjson not installed")
+    def test_jsonify_backends(self):
+        data = {"a": [1, 2], "b": None}
+
+        # orjson only supports 2 space indentation, so this shows which backend ran
+        orjson_output = jsonify(data, indent=4)
+        assert orjson_output.startswith('{\n  "a"')
+
+        with patch("pyinfra_cli.prints.orjson", None):
+            stdlib_output = jsonify(data, indent=4)
+        assert stdlib_output.startswith('{\n    "a"')
+
+        assert json.loads(orjson_output) == json.loads(stdlib_output)
+
+    def test_stringify_host_keys(self):
+        inventory = Inventory((["somehost"], {}))
+        host = inventory.get_host("somehost")
+
+        no_hosts = {"a": {"b": [1, 2]}}
+        assert _stringify_host_keys(no_hosts) is no_hosts
+
+        data = {"a": {"b": 1}, "hosts": {host: no_hosts}}
+        stringified = _stringify_host_keys(data)
+        assert stringified == {"a": {"b": 1}, "hosts": {"somehost": no_hosts}}
+        assert stringified["a"] is data["a"]
+
+    def test_truncated_join(self):
+        assert _truncated_join(["c", "a", "b"], 48) == "a, b, c"
+
+        names = ["host-{0:03}".format(i) for i in range(100, 0, -1)]
+        assert _truncated_join(names, 48) == ("host-001, host-002, host-003, host-004, host-...")
+
+    def test_pretty_op_name(self):
+        op_meta = StateOperationMeta((1,))
+        op_meta.names.add("Do a thing")
+        assert pretty_op_name(op_meta) == "Do a thing"
+
+        # Meta is shared and updated as more hosts add the same operation
+        op_meta.args.append("arg")
+        assert pretty_op_name(op_meta) == "Do a thing (arg)"
+
+    def test_jsonify_custom_kwargs(self):
+        assert jsonify({"b": 1, "a": 2}, sort_keys=True) == '{"a": 2, "b": 1}'
+
+    def test_print_rows(self):
+        lines = []
+        print_rows(
+            [
+                (lines.append, ["Operation", "Hosts"]),
+                (lines.append, "a string row"),
+                (lines.append, [click.style("Do a thing", "green"), "1"]),
+            ],
+        )
+
+        assert lines == [
+            "Operation     Hosts    ",
+            "a string row",
+            "{0}    1        ".format(click.style("Do a thing", "green")),
+        ]
+
+
+class TestCliPrintsState(PatchSSHTestCase):
+    def setUp(self):
+        inventory = make_inventory()
+        self.state = State(inventory, Config())
+        connect_all(self.state)
+
+        add_op(self.state, server.shell, "echo hello")
+        add_op(self.state, server.shell, "echo world", host=inventory.get_host("somehost"))
+
+    def get_printed_lines(self, func):
+        with patch("pyinfra_cli.prints.logger") as fake_logger:
+            func(self.state)
+        return [call[0][0].rstrip() for call in fake_logger.info.call_args_list]
+
+    def test_print_meta(self):
+        lines = self.get_printed_lines(print_meta)
+        assert lines == [
+            "Operation                    Change                       Conditional Change",
+            "server.shell (echo hello)    2 (anotherhost, somehost)    -",
+            "server.shell (echo world)    1 (somehost)                 -",
+        ]
+
+    def test_print_results(self):
+        run_ops(self.state)
+
+        lines = self.get_printed_lines(print_results)
+        assert lines == [
+            "Operation                    Hosts    Success    Error    No Change",
+            "server.shell (echo hello)    2        2          -        -",
+            "server.shell (echo world)    1        1          -        -",
+        ]
+
+    def test_print_state_operations(self):
+        with patch("pyinfra_cli.prints.click") as fake_click:
+            print_state_operations(self.state)
+
+        lines = [call[0][0] for call in fake_click.echo.call_args_list if call[0]]
+        order_lines = [line for line in lines if line.startswith("    ")]
+        assert len(order_lines) == 2
+        assert "hosts={" in order_lines[1]
+        assert "somehost" in order_lines[1]
+        assert "anotherhost" not in order_lines[1]
+
+    @skipUnless(orjson, "orjson not installed")
+    def test_print_state_operations_json_backends(self):
+        def get_json_blocks():
+            with patch("pyinfra_cli.prints.click") as fake_click:
+                print_state_operations(self.state)
+            lines = [call[0][0] for call in fake_click.echo.call_args_list if call[0]]
+            return [line for line in lines if line.startswith(("{", "["))]
+
+        orjson_blocks = get_json_blocks()
+        with patch("pyinfra_cli.prints.orjson", None):
+            stdlib_blocks = get_json_blocks()
+
+        assert len(orjson_blocks) == 2
+        # orjson only supports 2 space indentation, so this shows which backend ran
+        assert all(block.startswith('{\n  "') for block in orjson_blocks)
+        assert all(block.startswith('{\n    "') for block in stdlib_blocks)
+        assert [json.loads(block) for block in orjson_blocks] == [
+            json.loads(block) for block in stdlib_blocks
+        ]